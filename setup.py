@@ -0,0 +1,29 @@
+"""
+Build the optional compiled Black '76 kernel in place:
+
+    python setup.py build_ext --inplace
+
+black76_price falls back to the pure-Python kernel when the extension is absent.
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    packages=[],
+    ext_modules=cythonize(
+        [
+            Extension(
+                "src.pricing._black76",
+                ["src/pricing/_black76.pyx", "src/pricing/_black76_avx.c"],
+                include_dirs=["src/pricing"],
+                libraries=["m"],
+                # No -ffast-math (it folds away the + 0.0 that normalizes -0.0 premiums)
+                # and no -march=native: the AVX2 kernel is picked at runtime, so the
+                # extension must load on any x86-64 CPU
+                extra_compile_args=["-O3"],
+            ),
+        ],
+        language_level=3,
+    ),
+)
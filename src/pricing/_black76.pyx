@@ -0,0 +1,109 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled Black '76 kernel for SPX Index Options.
+
+Mirrors the pure-Python path in black76.py (erf or A&S normal CDF, ±1 call/put sign).
+"""
+
+from libc.math cimport erf, exp, fabs, log, sqrt
+
+
+cdef extern from "_black76_avx.h":
+    void norm_cdf_pdf_batch(const double* x, double* cdf, double* pdf, size_t n) noexcept nogil
+
+cdef double _INV_SQRT_2 = 0.7071067811865476
+cdef double _INV_SQRT_2PI = 0.3989422804014327
+
+# Same cutoff as _TAIL_CUTOFF in black76.py
+cdef double _TAIL_CUTOFF = 8.0
+
+# Abramowitz & Stegun 26.2.17 coefficients (absolute error < 7.5e-8)
+cdef double _AS_P = 0.2316419
+cdef double _AS_A1 = 0.319381530
+cdef double _AS_A2 = -0.356563782
+cdef double _AS_A3 = 1.781477937
+cdef double _AS_A4 = -1.821255978
+cdef double _AS_A5 = 1.330274429
+
+
+cdef inline double _norm_cdf_from_pdf(double x, double pdf_x) noexcept nogil:
+    cdef double t = 1.0 / (1.0 + _AS_P * fabs(x))
+    cdef double tail = pdf_x * t * (_AS_A1 + t * (_AS_A2 + t * (_AS_A3 + t * (_AS_A4 + t * _AS_A5))))
+    return 1.0 - tail if x >= 0.0 else tail
+
+
+cdef void black76_kernel(
+        double forward_price,
+        double strike,
+        double dcf,
+        double df,
+        double implied_volatility,
+        int is_call,
+        int use_erf,
+        double* out,
+) noexcept nogil:
+    """Write price, delta, gamma, vega into out[0..3]. Inputs are assumed valid."""
+    cdef double sqrt_t = sqrt(dcf)
+    cdef double vol_sqrt_t = implied_volatility * sqrt_t
+    cdef double d_1 = (log(forward_price / strike) + 0.5 * implied_volatility * implied_volatility * dcf) / vol_sqrt_t
+    cdef double d_2 = d_1 - vol_sqrt_t
+
+    cdef double pdf_d1, pdf_d2, nd1, nd2
+
+    # Calls and puts share one formula: s = +1 / -1 and N(-x) = 1 - N(x)
+    cdef double s = 1.0 if is_call else -1.0
+    cdef double sd_1 = s * d_1
+    cdef double sd_2 = s * d_2
+
+    # Deep wings skip the transcendentals entirely
+    cdef bint d1_in_tail = fabs(d_1) > _TAIL_CUTOFF
+    if d1_in_tail:
+        nd1 = 1.0 if sd_1 > 0.0 else 0.0
+        pdf_d1 = 0.0
+    else:
+        # The density feeds gamma/vega and the A&S CDF tail
+        pdf_d1 = exp(-0.5 * d_1 * d_1) * _INV_SQRT_2PI
+        nd1 = 0.5 * (1.0 + erf(sd_1 * _INV_SQRT_2)) if use_erf else _norm_cdf_from_pdf(sd_1, pdf_d1)
+
+    if fabs(d_2) > _TAIL_CUTOFF:
+        nd2 = 1.0 if sd_2 > 0.0 else 0.0
+    elif use_erf:
+        nd2 = 0.5 * (1.0 + erf(sd_2 * _INV_SQRT_2))
+    else:
+        # F·φ(d1) = K·φ(d2) saves the second exp unless d1 was cut off
+        pdf_d2 = exp(-0.5 * d_2 * d_2) * _INV_SQRT_2PI if d1_in_tail else pdf_d1 * forward_price / strike
+        nd2 = _norm_cdf_from_pdf(sd_2, pdf_d2)
+
+    # Price: s × df × [F × N(s·d1) - K × N(s·d2)]; + 0.0 normalizes -0.0
+    out[0] = s * df * (forward_price * nd1 - strike * nd2) + 0.0
+    out[1] = s * df * nd1 + 0.0
+    # Gamma: ∂²V/∂F²
+    out[2] = df * pdf_d1 / (forward_price * vol_sqrt_t)
+    # Vega: ∂V/∂σ (per 1% move)
+    out[3] = df * forward_price * pdf_d1 * sqrt_t / 100.0
+
+
+cpdef tuple black76(
+        double forward_price,
+        double strike,
+        double dcf,
+        double df,
+        double implied_volatility,
+        bint is_call,
+        bint use_erf=True,
+):
+    """Return (price, delta, gamma, vega) from the compiled kernel (C99 erf or A&S normal CDF)."""
+    cdef double out[4]
+    black76_kernel(forward_price, strike, dcf, df, implied_volatility, is_call, use_erf, out)
+    return out[0], out[1], out[2], out[3]
+
+
+def norm_cdf_pdf(const double[::1] x, double[::1] cdf, double[::1] pdf):
+    """Fill cdf and pdf with N(x) and φ(x) elementwise (AVX2 when the CPU supports it)."""
+    cdef Py_ssize_t n = x.shape[0]
+    if cdf.shape[0] != n or pdf.shape[0] != n:
+        raise ValueError("x, cdf and pdf must have the same length")
+    if n == 0:
+        return
+    with nogil:
+        norm_cdf_pdf_batch(&x[0], &cdf[0], &pdf[0], <size_t>n)
@@ -0,0 +1,136 @@
+/*
+ * SIMD normal CDF/PDF kernel for the batch Black '76 pricer.
+ *
+ * Evaluates the Abramowitz & Stegun 26.2.17 polynomial four doubles per
+ * iteration with AVX2/FMA, sharing one vectorized exp(-x²/2) between the
+ * density and the CDF tail. The AVX2 path is selected at runtime; other CPUs
+ * and the remainder lanes use the scalar loop.
+ */
+
+#include <math.h>
+
+#include "_black76_avx.h"
+
+#define INV_SQRT_2PI 0.3989422804014327
+
+/* Same cutoff as _TAIL_CUTOFF in black76.py */
+#define TAIL_CUTOFF 8.0
+
+/* Abramowitz & Stegun 26.2.17 coefficients */
+#define AS_P 0.2316419
+#define AS_A1 0.319381530
+#define AS_A2 -0.356563782
+#define AS_A3 1.781477937
+#define AS_A4 -1.821255978
+#define AS_A5 1.330274429
+
+static void norm_cdf_pdf_scalar(const double *x, double *cdf, double *pdf, size_t n)
+{
+    for (size_t i = 0; i < n; i++) {
+        double xi = x[i];
+        double ax = fabs(xi);
+        if (ax > TAIL_CUTOFF) {
+            cdf[i] = xi > 0.0 ? 1.0 : 0.0;
+            pdf[i] = 0.0;
+            continue;
+        }
+        double p = exp(-0.5 * xi * xi) * INV_SQRT_2PI;
+        double t = 1.0 / (1.0 + AS_P * ax);
+        double tail = p * t * (AS_A1 + t * (AS_A2 + t * (AS_A3 + t * (AS_A4 + t * AS_A5))));
+        cdf[i] = xi >= 0.0 ? 1.0 - tail : tail;
+        pdf[i] = p;
+    }
+}
+
+#if (defined(__x86_64__) || defined(__i386__)) && (defined(__GNUC__) || defined(__clang__))
+#define HAVE_AVX2_KERNEL 1
+
+#include <immintrin.h>
+
+/* exp(y) for y in [-32, 0]: Cody-Waite reduction by ln 2, degree-12 Taylor series, 2^k via exponent bits */
+__attribute__((target("avx2,fma")))
+static inline __m256d exp_avx2(__m256d y)
+{
+    const __m256d log2e = _mm256_set1_pd(1.4426950408889634);
+    const __m256d ln2_hi = _mm256_set1_pd(6.93147180369123816490e-01);
+    const __m256d ln2_lo = _mm256_set1_pd(1.90821492927058770002e-10);
+    const __m256d magic = _mm256_set1_pd(6755399441055744.0); /* 2^52 + 2^51 */
+
+    __m256d k = _mm256_round_pd(_mm256_mul_pd(y, log2e), _MM_FROUND_TO_NEAREST_INT | _MM_FROUND_NO_EXC);
+    __m256d r = _mm256_fnmadd_pd(k, ln2_hi, y);
+    r = _mm256_fnmadd_pd(k, ln2_lo, r);
+
+    __m256d e = _mm256_set1_pd(1.0 / 479001600.0);
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 39916800.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 3628800.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 362880.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 40320.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 5040.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 720.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 120.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 24.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0 / 6.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(0.5));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0));
+    e = _mm256_fmadd_pd(e, r, _mm256_set1_pd(1.0));
+
+    /* k as int64 through the 2^52 + 2^51 rounding trick, then biased into the exponent field */
+    __m256i ki = _mm256_sub_epi64(_mm256_castpd_si256(_mm256_add_pd(k, magic)), _mm256_castpd_si256(magic));
+    __m256i bits = _mm256_slli_epi64(_mm256_add_epi64(ki, _mm256_set1_epi64x(1023)), 52);
+    return _mm256_mul_pd(e, _mm256_castsi256_pd(bits));
+}
+
+__attribute__((target("avx2,fma")))
+static void norm_cdf_pdf_avx2(const double *x, double *cdf, double *pdf, size_t n)
+{
+    const __m256d sign_mask = _mm256_set1_pd(-0.0);
+    const __m256d zero = _mm256_setzero_pd();
+    const __m256d one = _mm256_set1_pd(1.0);
+    const __m256d neg_half = _mm256_set1_pd(-0.5);
+    const __m256d inv_sqrt_2pi = _mm256_set1_pd(INV_SQRT_2PI);
+    const __m256d cutoff = _mm256_set1_pd(TAIL_CUTOFF);
+    const __m256d as_p = _mm256_set1_pd(AS_P);
+
+    size_t i = 0;
+    for (; i + 4 <= n; i += 4) {
+        __m256d xv = _mm256_loadu_pd(x + i);
+        __m256d ax = _mm256_andnot_pd(sign_mask, xv);
+        __m256d in_tail = _mm256_cmp_pd(ax, cutoff, _CMP_GT_OQ);
+        __m256d nonneg = _mm256_cmp_pd(xv, zero, _CMP_GE_OQ);
+
+        /* Clamp so exp stays in range; tail lanes are overwritten below.
+         * minpd returns its second operand when either is NaN, so ax goes
+         * second and NaN lanes stay NaN instead of becoming the cutoff. */
+        ax = _mm256_min_pd(cutoff, ax);
+        __m256d p = _mm256_mul_pd(exp_avx2(_mm256_mul_pd(neg_half, _mm256_mul_pd(ax, ax))), inv_sqrt_2pi);
+
+        __m256d t = _mm256_div_pd(one, _mm256_fmadd_pd(as_p, ax, one));
+        __m256d poly = _mm256_set1_pd(AS_A5);
+        poly = _mm256_fmadd_pd(poly, t, _mm256_set1_pd(AS_A4));
+        poly = _mm256_fmadd_pd(poly, t, _mm256_set1_pd(AS_A3));
+        poly = _mm256_fmadd_pd(poly, t, _mm256_set1_pd(AS_A2));
+        poly = _mm256_fmadd_pd(poly, t, _mm256_set1_pd(AS_A1));
+        __m256d tail = _mm256_mul_pd(_mm256_mul_pd(p, t), poly);
+
+        __m256d c = _mm256_blendv_pd(tail, _mm256_sub_pd(one, tail), nonneg);
+        c = _mm256_blendv_pd(c, _mm256_and_pd(nonneg, one), in_tail);
+        p = _mm256_andnot_pd(in_tail, p);
+
+        _mm256_storeu_pd(cdf + i, c);
+        _mm256_storeu_pd(pdf + i, p);
+    }
+
+    norm_cdf_pdf_scalar(x + i, cdf + i, pdf + i, n - i);
+}
+#endif
+
+void norm_cdf_pdf_batch(const double *x, double *cdf, double *pdf, size_t n)
+{
+#ifdef HAVE_AVX2_KERNEL
+    if (__builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma")) {
+        norm_cdf_pdf_avx2(x, cdf, pdf, n);
+        return;
+    }
+#endif
+    norm_cdf_pdf_scalar(x, cdf, pdf, n);
+}
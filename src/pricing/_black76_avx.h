@@ -0,0 +1,9 @@
+#ifndef BLACK76_AVX_H
+#define BLACK76_AVX_H
+
+#include <stddef.h>
+
+/* Fill cdf[i] = N(x[i]) and pdf[i] = φ(x[i]) for i < n (A&S 26.2.17, |error| < 7.5e-8). */
+void norm_cdf_pdf_batch(const double *x, double *cdf, double *pdf, size_t n);
+
+#endif
@@ -4,9 +4,23 @@ Black '76 Model for SPX Index Options.
 
 from __future__ import annotations
 
+import functools
 import math
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy.special import ndtr
+
+try:
+    from src.pricing._black76 import black76 as _black76_compiled
+    from src.pricing._black76 import norm_cdf_pdf as _norm_cdf_pdf_simd
+except ImportError:
+    _black76_compiled = None
+    _norm_cdf_pdf_simd = None
 
 
 class OptionType(str, Enum):
@@ -15,8 +29,7 @@ class OptionType(str, Enum):
     PUT = "put"
 
 
-@dataclass(frozen=True)
-class SPXOptionResult:
+class SPXOptionResult(NamedTuple):
     """
     Result of SPX option pricing.
 
@@ -47,14 +60,138 @@ class SPXOptionResult:
         }
 
 
-def norm_cdf(x: float) -> float:
-    """Standard normal CDF using error function."""
-    return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+# eq=False: a generated __eq__ would compare ndarrays, whose truth value is ambiguous
+@dataclass(frozen=True, eq=False)
+class SPXOptionResultBatch:
+    """
+    Result of batch SPX option pricing, one float64 array per field.
+
+    Attributes:
+        price: Option premiums per index point (multiply by $100 for USD value)
+        delta: Sensitivities to 1-point move in forward
+        gamma: Rates of delta change per 1-point move
+        vega: Sensitivities to 1% change in implied volatility
+    """
+    price: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    vega: np.ndarray
+
+    def __len__(self) -> int:
+        return self.price.size
+
+    @property
+    def dollar_price(self) -> np.ndarray:
+        """Option prices in USD (SPX multiplier is $100)."""
+        return self.price * 100.0
+
+    def to_dict(self, decimals: int = 4) -> dict:
+        """Convert to dictionary of lists with rounded values."""
+        return {
+            "price": np.round(self.price, decimals).tolist(),
+            "dollar_price": np.round(self.dollar_price, 2).tolist(),
+            "delta": np.round(self.delta, decimals).tolist(),
+            "gamma": np.round(self.gamma, 6).tolist(),
+            "vega": np.round(self.vega, decimals).tolist(),
+        }
+
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+# Past |d| > 8 the normal tail is below 1e-15: N(d) is taken as 0 or 1 and φ(d) as 0
+_TAIL_CUTOFF = 8.0
+
+# Abramowitz & Stegun 26.2.17 coefficients (absolute error < 7.5e-8)
+_AS_P = 0.2316419
+_AS_A1 = 0.319381530
+_AS_A2 = -0.356563782
+_AS_A3 = 1.781477937
+_AS_A4 = -1.821255978
+_AS_A5 = 1.330274429
 
 
 def norm_pdf(x: float) -> float:
     """Standard normal PDF."""
-    return math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
+
+def norm_cdf(x: float) -> float:
+    """Standard normal CDF using error function (exact to double precision)."""
+    return 0.5 * (1.0 + math.erf(x * _INV_SQRT_2))
+
+
+def _norm_cdf_from_pdf(x: float, pdf_x: float) -> float:
+    """
+    Abramowitz & Stegun normal CDF from an already computed PDF value at x.
+
+    Only pays off when compiled (numba) next to a shared exp; in plain Python
+    one math.erf call is both faster and exact.
+    """
+    t = 1.0 / (1.0 + _AS_P * abs(x))
+    tail = pdf_x * t * (_AS_A1 + t * (_AS_A2 + t * (_AS_A3 + t * (_AS_A4 + t * _AS_A5))))
+    return 1.0 - tail if x >= 0.0 else tail
+
+
+def _norm_cdf_as(x: float) -> float:
+    """Standard normal CDF using the Abramowitz & Stegun polynomial (error < 7.5e-8)."""
+    return _norm_cdf_from_pdf(x, norm_pdf(x))
+
+
+def _norm_cdf_logistic(x: float) -> float:
+    """
+    Logistic approximation Φ(x) ≈ 1 / (1 + e^(-1.702x)).
+
+    Absolute error is below 0.01 everywhere; good enough for ranking or
+    screening strikes, not for quoting.
+    """
+    if x >= 0.0:
+        return 1.0 / (1.0 + math.exp(-1.702 * x))
+    e = math.exp(1.702 * x)
+    return e / (1.0 + e)
+
+
+# Normal CDF implementations selectable via black76_price(cdf_method=...)
+_NORM_CDF_IMPLS = {
+    "as": _norm_cdf_as,
+    "erf": norm_cdf,
+    "logistic": _norm_cdf_logistic,
+}
+
+# Error-message labels of the _check_inputs arguments, in order
+_INPUT_LABELS = ("Forward", "Strike", "DCF", "Discount factor", "Volatility")
+
+
+def _check_inputs(
+        forward_price: float | np.ndarray = 1.0,
+        strike: float | np.ndarray = 1.0,
+        dcf: float | np.ndarray = 1.0,
+        df: float | np.ndarray = 1.0,
+        implied_volatility: float | np.ndarray = 1.0,
+) -> None:
+    """
+    Raise ValueError unless every input is positive and finite.
+
+    Takes all scalars or, from the batch pricers, all arrays; inputs left at
+    the default are not checked. Scalars get one chained comparison and
+    only a failure pays for finding which input to report.
+    """
+    values = (forward_price, strike, dcf, df, implied_volatility)
+    if isinstance(forward_price, np.ndarray):
+        for label, value in zip(_INPUT_LABELS, values):
+            if not np.all((value > 0.0) & (value < math.inf)):
+                raise ValueError(f"{label} must be positive and finite")
+    elif not (0.0 < forward_price < math.inf and 0.0 < strike < math.inf and 0.0 < dcf < math.inf
+              and 0.0 < df < math.inf and 0.0 < implied_volatility < math.inf):
+        for label, value in zip(_INPUT_LABELS, values):
+            if not 0.0 < value < math.inf:
+                raise ValueError(f"{label} must be positive and finite, got {value}")
+
+
+def _check_cdf_method(cdf_method: str) -> None:
+    """Raise ValueError unless cdf_method names a _NORM_CDF_IMPLS entry."""
+    if cdf_method not in _NORM_CDF_IMPLS:
+        raise ValueError(f"CDF method must be one of {sorted(_NORM_CDF_IMPLS)}, got {cdf_method!r}")
 
 
 def black76_price(
@@ -64,6 +201,7 @@ def black76_price(
         df: float,
         implied_volatility: float,
         option_type: OptionType | str,
+        cdf_method: str = "erf",
 ) -> SPXOptionResult:
     """
     Price an SPX index option using Black '76.
@@ -78,39 +216,80 @@ def black76_price(
         df: Discount factor e^(-rT)
         implied_volatility: Implied volatility (e.g., 0.15 for 15%)
         option_type: "call" or "put"
+        cdf_method: Normal CDF implementation: "erf" (exact), "as" (Abramowitz
+            & Stegun, error < 7.5e-8) or "logistic" (error < 0.01)
 
     Returns:
         SPXOptionResult with price and Greeks
     """
-    if forward_price <= 0:
-        raise ValueError(f"Forward must be positive, got {forward_price}")
-    if strike <= 0:
-        raise ValueError(f"Strike must be positive, got {strike}")
-    if dcf <= 0:
-        raise ValueError(f"DCF must be positive, got {dcf}")
-    if implied_volatility <= 0:
-        raise ValueError(f"Volatility must be positive, got {implied_volatility}")
+    _check_inputs(forward_price=forward_price, strike=strike, dcf=dcf, df=df, implied_volatility=implied_volatility)
+    _check_cdf_method(cdf_method)
 
     if isinstance(option_type, str):
         option_type = OptionType(option_type.lower())
 
+    return _black76_unchecked(
+        forward_price, strike, dcf, df, implied_volatility, option_type == OptionType.CALL, cdf_method
+    )
+
+
+def _black76_unchecked(
+        forward_price: float,
+        strike: float,
+        dcf: float,
+        df: float,
+        implied_volatility: float,
+        is_call: bool,
+        cdf_method: str = "erf",
+) -> SPXOptionResult:
+    """
+    black76_price without input validation, taking the option type as a flag.
+
+    Callers must guarantee positive inputs and a known cdf_method (e.g. the
+    MCP tool, whose pydantic fields already enforce this).
+    """
+    if _black76_compiled is not None and cdf_method in ("erf", "as"):
+        return SPXOptionResult._make(_black76_compiled(
+            forward_price, strike, dcf, df, implied_volatility, is_call, cdf_method == "erf"
+        ))
+
     # d1, d2
     sqrt_t = math.sqrt(dcf)
-    d_1 = (math.log(forward_price / strike) + (implied_volatility ** 2 / 2) * dcf) / (implied_volatility * sqrt_t)
-    d_2 = d_1 - implied_volatility * sqrt_t
+    vol_sqrt_t = implied_volatility * sqrt_t
+    d_1 = (math.log(forward_price / strike) + 0.5 * implied_volatility * implied_volatility * dcf) / vol_sqrt_t
+    d_2 = d_1 - vol_sqrt_t
 
-    pdf_d1 = norm_pdf(d_1)
+    # Calls and puts share one formula: s = +1 / -1 and N(-x) = 1 - N(x)
+    s = 1.0 if is_call else -1.0
+    sd_1 = s * d_1
+    sd_2 = s * d_2
 
-    # Price
-    if option_type == OptionType.CALL:
-        price = df * (forward_price * norm_cdf(d_1) - strike * norm_cdf(d_2))
-        delta = df * norm_cdf(d_1)
+    # Deep wings skip the transcendentals entirely
+    d1_in_tail = abs(d_1) > _TAIL_CUTOFF
+    if d1_in_tail:
+        nd1 = 1.0 if sd_1 > 0.0 else 0.0
+        pdf_d1 = 0.0
     else:
-        price = df * (strike * norm_cdf(-d_2) - forward_price * norm_cdf(-d_1))
-        delta = -df * norm_cdf(-d_1)
+        # The density feeds gamma/vega and the A&S CDF tail
+        pdf_d1 = math.exp(-0.5 * d_1 * d_1) * _INV_SQRT_2PI
+        nd1 = _norm_cdf_from_pdf(sd_1, pdf_d1) if cdf_method == "as" else _NORM_CDF_IMPLS[cdf_method](sd_1)
+
+    if abs(d_2) > _TAIL_CUTOFF:
+        nd2 = 1.0 if sd_2 > 0.0 else 0.0
+    elif cdf_method == "as":
+        # F·φ(d1) = K·φ(d2) saves the second exp unless d1 was cut off
+        pdf_d2 = norm_pdf(d_2) if d1_in_tail else pdf_d1 * forward_price / strike
+        nd2 = _norm_cdf_from_pdf(sd_2, pdf_d2)
+    else:
+        nd2 = _NORM_CDF_IMPLS[cdf_method](sd_2)
+
+    # Price: s × df × [F × N(s·d1) - K × N(s·d2)]; + 0.0 turns the -0.0 of
+    # deep out-of-the-money puts (s = -1, both N terms 0) into +0.0
+    price = s * df * (forward_price * nd1 - strike * nd2) + 0.0
+    delta = s * df * nd1 + 0.0
 
     # Gamma: ∂²V/∂F²
-    gamma = df * pdf_d1 / (forward_price * implied_volatility * sqrt_t)
+    gamma = df * pdf_d1 / (forward_price * vol_sqrt_t)
 
     # Vega: ∂V/∂σ (per 1% move)
     vega = df * forward_price * pdf_d1 * sqrt_t / 100.0
@@ -123,6 +302,217 @@ def black76_price(
     )
 
 
+def implied_vol_newton(
+        target_price: float,
+        forward_price: float,
+        strike: float,
+        dcf: float,
+        df: float,
+        option_type: OptionType | str,
+        tol: float = 1e-8,
+        max_iter: int = 50,
+        cdf_method: str = "erf",
+) -> float:
+    """
+    Implied volatility of an SPX index option premium under Black '76.
+
+    Newton iteration on σ using analytic vega as the derivative. The start is
+    the Brenner-Subrahmanyam guess √(2π/T) × P / (df × F), raised to the vega
+    inflection point √(2|ln(F/K)| / T) away from the money so Newton cannot
+    overshoot from the flat low-vega region. Typically converges in 4-6
+    iterations.
+
+    Args:
+        target_price: Observed option premium per index point
+        forward_price: Forward index level
+        strike: Strike price
+        dcf: Day count fraction (time to expiry in years)
+        df: Discount factor e^(-rT)
+        option_type: "call" or "put"
+        tol: Absolute tolerance on the repriced premium
+        max_iter: Maximum number of Newton steps
+        cdf_method: Normal CDF used to reprice, as in black76_price
+
+    Returns:
+        Implied volatility (e.g., 0.15 for 15%)
+    """
+    _check_inputs(forward_price=forward_price, strike=strike, dcf=dcf, df=df)
+    _check_cdf_method(cdf_method)
+
+    if isinstance(option_type, str):
+        option_type = OptionType(option_type.lower())
+    is_call = option_type == OptionType.CALL
+
+    # No-arbitrage bounds: discounted intrinsic < P < df × F (call) or df × K (put)
+    if is_call:
+        lower, upper = df * max(forward_price - strike, 0.0), df * forward_price
+    else:
+        lower, upper = df * max(strike - forward_price, 0.0), df * strike
+    if not lower < target_price < upper:
+        raise ValueError(f"Price must lie in ({lower}, {upper}), got {target_price}")
+
+    implied_volatility = max(
+        math.sqrt(2.0 * math.pi / dcf) * target_price / (df * forward_price),
+        math.sqrt(2.0 * abs(math.log(forward_price / strike)) / dcf),
+    )
+    for _ in range(max_iter):
+        result = _black76_unchecked(forward_price, strike, dcf, df, implied_volatility, is_call, cdf_method)
+        diff = result.price - target_price
+        if abs(diff) < tol:
+            return implied_volatility
+
+        # Vega is reported per 1% move; Newton needs ∂V/∂σ
+        vega = result.vega * 100.0
+        if vega <= 0.0:
+            break
+        step = diff / vega
+        # Halve instead of stepping through zero volatility
+        implied_volatility = implied_volatility - step if step < implied_volatility else 0.5 * implied_volatility
+
+    raise ValueError(f"Implied volatility did not converge for price {target_price}")
+
+
+def make_pricer(
+        dcf: float,
+        df: float,
+        option_type: OptionType | str,
+) -> Callable[[float, float, float], SPXOptionResult]:
+    """
+    Build a Black '76 pricer specialised to one expiry and option type.
+
+    Smile pricing varies only strike and volatility at a fixed expiry, so dcf,
+    df and the option type are validated and bound once; each call then skips
+    straight to the shared kernel. Pricers are cached per (dcf, df, option_type).
+
+    Args:
+        dcf: Day count fraction (time to expiry in years)
+        df: Discount factor e^(-rT)
+        option_type: "call" or "put"
+
+    Returns:
+        Callable (forward_price, strike, implied_volatility) -> SPXOptionResult
+    """
+    _check_inputs(dcf=dcf, df=df)
+
+    if isinstance(option_type, str):
+        option_type = OptionType(option_type.lower())
+
+    return _make_pricer(dcf, df, option_type)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_pricer(
+        dcf: float,
+        df: float,
+        option_type: OptionType,
+) -> Callable[[float, float, float], SPXOptionResult]:
+    """Specialised pricer factory behind make_pricer; arguments must be pre-validated."""
+    is_call = option_type == OptionType.CALL
+
+    def price(forward_price: float, strike: float, implied_volatility: float) -> SPXOptionResult:
+        _check_inputs(forward_price=forward_price, strike=strike, implied_volatility=implied_volatility)
+        return _black76_unchecked(forward_price, strike, dcf, df, implied_volatility, is_call)
+
+    return price
+
+
+def _norm_cdf_pdf_array(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """N(x) and φ(x) elementwise through the compiled SIMD kernel."""
+    x = np.asarray(x, dtype=np.float64, order="C")
+    cdf = np.empty_like(x)
+    pdf = np.empty_like(x)
+    _norm_cdf_pdf_simd(x.reshape(-1), cdf.reshape(-1), pdf.reshape(-1))
+    return cdf, pdf
+
+
+def _broadcast_arrays(*values: ArrayLike, is_call: ArrayLike) -> list[np.ndarray]:
+    """Broadcast values as float64 arrays, followed by is_call as a bool array."""
+    return np.broadcast_arrays(
+        *(np.asarray(value, dtype=np.float64) for value in values),
+        np.asarray(is_call, dtype=bool),
+    )
+
+
+def _broadcast_batch_inputs(
+        forward_price: ArrayLike,
+        strike: ArrayLike,
+        dcf: ArrayLike,
+        df: ArrayLike,
+        implied_volatility: ArrayLike,
+        is_call: ArrayLike,
+) -> tuple[np.ndarray, ...]:
+    """Coerce batch inputs to broadcast float64/bool arrays and validate them."""
+    forward_price, strike, dcf, df, implied_volatility, is_call = _broadcast_arrays(
+        forward_price, strike, dcf, df, implied_volatility, is_call=is_call
+    )
+    _check_inputs(forward_price=forward_price, strike=strike, dcf=dcf, df=df, implied_volatility=implied_volatility)
+    return forward_price, strike, dcf, df, implied_volatility, is_call
+
+
+def black76_price_batch(
+        forward_price: ArrayLike,
+        strike: ArrayLike,
+        dcf: ArrayLike,
+        df: ArrayLike,
+        implied_volatility: ArrayLike,
+        is_call: ArrayLike,
+) -> SPXOptionResultBatch:
+    """
+    Price a batch of SPX index options using Black '76.
+
+    Vectorized counterpart of black76_price: inputs are broadcast against each
+    other and every contract is priced in one pass of NumPy ufuncs. The normal
+    CDF is scipy's ndtr, or the compiled AVX2 A&S kernel (error < 7.5e-8) when
+    the extension is built.
+
+    Args:
+        forward_price: Forward index levels
+        strike: Strike prices
+        dcf: Day count fractions (time to expiry in years)
+        df: Discount factors e^(-rT)
+        implied_volatility: Implied volatilities (e.g., 0.15 for 15%)
+        is_call: True for calls, False for puts
+
+    Returns:
+        SPXOptionResultBatch with price and Greeks arrays
+    """
+    forward_price, strike, dcf, df, implied_volatility, is_call = _broadcast_batch_inputs(
+        forward_price, strike, dcf, df, implied_volatility, is_call
+    )
+
+    # d1, d2
+    sqrt_t = np.sqrt(dcf)
+    vol_sqrt_t = implied_volatility * sqrt_t
+    d_1 = (np.log(forward_price / strike) + 0.5 * implied_volatility * implied_volatility * dcf) / vol_sqrt_t
+    d_2 = d_1 - vol_sqrt_t
+
+    # Price: s × df × [F × N(s·d1) - K × N(s·d2)] with s = +1 / -1 for calls / puts
+    s = np.where(is_call, 1.0, -1.0)
+    s_df = s * df
+    if _norm_cdf_pdf_simd is not None:
+        nd1, pdf_d1 = _norm_cdf_pdf_array(s * d_1)
+        nd2, _ = _norm_cdf_pdf_array(s * d_2)
+    else:
+        pdf_d1 = np.exp(-0.5 * d_1 * d_1) * _INV_SQRT_2PI
+        nd1 = ndtr(s * d_1)
+        nd2 = ndtr(s * d_2)
+    price = s_df * (forward_price * nd1 - strike * nd2) + 0.0
+    delta = s_df * nd1 + 0.0
+
+    # Gamma: ∂²V/∂F²
+    gamma = df * pdf_d1 / (forward_price * vol_sqrt_t)
+
+    # Vega: ∂V/∂σ (per 1% move)
+    vega = df * forward_price * pdf_d1 * sqrt_t / 100.0
+
+    return SPXOptionResultBatch(
+        price=price,
+        delta=delta,
+        gamma=gamma,
+        vega=vega,
+    )
+
+
 if __name__ == "__main__":
     # Example: ATM 30-day option
     # F=5000, K=5000, T=30/365, r=5% → df=e^(-0.05*30/365)≈0.9959, vol=15%
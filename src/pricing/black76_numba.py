@@ -0,0 +1,230 @@
+"""
+Numba-compiled Black '76 batch pricer for SPX Index Options.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numba
+import numpy as np
+from numpy.typing import ArrayLike
+
+from src.pricing.black76 import (
+    _INV_SQRT_2PI,
+    _TAIL_CUTOFF,
+    SPXOptionResultBatch,
+    _broadcast_arrays,
+    _broadcast_batch_inputs,
+    _check_inputs,
+    _norm_cdf_from_pdf,
+)
+
+# A&S normal CDF shared with the scalar kernel, so batch and scalar IVs agree
+_norm_cdf_from_pdf_jit = numba.njit(inline="always")(_norm_cdf_from_pdf)
+
+
+@numba.njit(inline="always")
+def _black76_scalar(
+        forward_price: float,
+        strike: float,
+        dcf: float,
+        df: float,
+        implied_volatility: float,
+        is_call: bool,
+) -> tuple[float, float, float, float]:
+    """Compiled _black76_unchecked(cdf_method="as"): (price, delta, gamma, vega) of one contract."""
+    # d1, d2
+    sqrt_t = math.sqrt(dcf)
+    vol_sqrt_t = implied_volatility * sqrt_t
+    d_1 = (math.log(forward_price / strike) + 0.5 * implied_volatility * implied_volatility * dcf) / vol_sqrt_t
+    d_2 = d_1 - vol_sqrt_t
+
+    # Calls and puts share one formula: s = +1 / -1 and N(-x) = 1 - N(x)
+    s = 1.0 if is_call else -1.0
+    sd_1 = s * d_1
+    sd_2 = s * d_2
+
+    # Deep wings skip the transcendentals entirely
+    d1_in_tail = abs(d_1) > _TAIL_CUTOFF
+    if d1_in_tail:
+        nd1 = 1.0 if sd_1 > 0.0 else 0.0
+        pdf_d1 = 0.0
+    else:
+        pdf_d1 = math.exp(-0.5 * d_1 * d_1) * _INV_SQRT_2PI
+        nd1 = _norm_cdf_from_pdf_jit(sd_1, pdf_d1)
+
+    if abs(d_2) > _TAIL_CUTOFF:
+        nd2 = 1.0 if sd_2 > 0.0 else 0.0
+    else:
+        # F·φ(d1) = K·φ(d2) saves the second exp unless d1 was cut off
+        if d1_in_tail:
+            pdf_d2 = math.exp(-0.5 * d_2 * d_2) * _INV_SQRT_2PI
+        else:
+            pdf_d2 = pdf_d1 * forward_price / strike
+        nd2 = _norm_cdf_from_pdf_jit(sd_2, pdf_d2)
+
+    # + 0.0 turns the -0.0 of deep out-of-the-money puts into +0.0
+    price = s * df * (forward_price * nd1 - strike * nd2) + 0.0
+    delta = s * df * nd1 + 0.0
+    gamma = df * pdf_d1 / (forward_price * vol_sqrt_t)
+    vega = df * forward_price * pdf_d1 * sqrt_t / 100.0
+    return price, delta, gamma, vega
+
+
+# fastmath without "nsz": the + 0.0 that normalizes -0.0 premiums must survive
+@numba.njit(parallel=True, fastmath={"contract", "arcp", "afn", "reassoc"}, cache=True)
+def _black76_kernel(
+        forward_price: np.ndarray,
+        strike: np.ndarray,
+        dcf: np.ndarray,
+        df: np.ndarray,
+        implied_volatility: np.ndarray,
+        is_call: np.ndarray,
+        price: np.ndarray,
+        delta: np.ndarray,
+        gamma: np.ndarray,
+        vega: np.ndarray,
+) -> None:
+    """Loop-style kernel: one contract per prange iteration, scalar libm calls only."""
+    for i in numba.prange(forward_price.shape[0]):
+        price[i], delta[i], gamma[i], vega[i] = _black76_scalar(
+            forward_price[i], strike[i], dcf[i], df[i], implied_volatility[i], is_call[i]
+        )
+
+
+def black76_price_batch_numba(
+        forward_price: ArrayLike,
+        strike: ArrayLike,
+        dcf: ArrayLike,
+        df: ArrayLike,
+        implied_volatility: ArrayLike,
+        is_call: ArrayLike,
+) -> SPXOptionResultBatch:
+    """
+    Price a batch of SPX index options using a Numba-compiled Black '76 kernel.
+
+    Same inputs and outputs as black76_price_batch. The kernel runs in parallel
+    across contracts; the first call pays JIT compilation unless a cached build
+    from a previous process is available.
+
+    Args:
+        forward_price: Forward index levels
+        strike: Strike prices
+        dcf: Day count fractions (time to expiry in years)
+        df: Discount factors e^(-rT)
+        implied_volatility: Implied volatilities (e.g., 0.15 for 15%)
+        is_call: True for calls, False for puts
+
+    Returns:
+        SPXOptionResultBatch with price and Greeks arrays
+    """
+    inputs = _broadcast_batch_inputs(forward_price, strike, dcf, df, implied_volatility, is_call)
+    shape = inputs[0].shape
+    flat = [np.ascontiguousarray(x).ravel() for x in inputs]
+
+    n = flat[0].shape[0]
+    price = np.empty(n)
+    delta = np.empty(n)
+    gamma = np.empty(n)
+    vega = np.empty(n)
+
+    _black76_kernel(*flat, price, delta, gamma, vega)
+
+    return SPXOptionResultBatch(
+        price=price.reshape(shape),
+        delta=delta.reshape(shape),
+        gamma=gamma.reshape(shape),
+        vega=vega.reshape(shape),
+    )
+
+
+@numba.njit(parallel=True, cache=True)
+def _implied_vol_kernel(
+        target_price: np.ndarray,
+        forward_price: np.ndarray,
+        strike: np.ndarray,
+        dcf: np.ndarray,
+        df: np.ndarray,
+        is_call: np.ndarray,
+        tol: float,
+        max_iter: int,
+        out: np.ndarray,
+) -> None:
+    """Newton iteration per contract; NaN where the premium has no implied volatility."""
+    for i in numba.prange(forward_price.shape[0]):
+        fwd = forward_price[i]
+        disc = df[i]
+        target = target_price[i]
+        s = 1.0 if is_call[i] else -1.0
+        out[i] = np.nan
+
+        # No-arbitrage bounds: discounted intrinsic < P < df × F (call) or df × K (put)
+        lower = disc * max(s * (fwd - strike[i]), 0.0)
+        upper = disc * fwd if is_call[i] else disc * strike[i]
+        if lower < target < upper:
+            # Brenner-Subrahmanyam guess, raised to the vega inflection point off the money
+            vol = max(
+                math.sqrt(2.0 * math.pi / dcf[i]) * target / (disc * fwd),
+                math.sqrt(2.0 * abs(math.log(fwd / strike[i])) / dcf[i]),
+            )
+            for _ in range(max_iter):
+                price, _delta, _gamma, vega = _black76_scalar(fwd, strike[i], dcf[i], disc, vol, is_call[i])
+                diff = price - target
+                if abs(diff) < tol:
+                    out[i] = vol
+                    break
+
+                # Vega is reported per 1% move; Newton needs ∂V/∂σ
+                vega = vega * 100.0
+                if vega <= 0.0:
+                    break
+                step = diff / vega
+                # Halve instead of stepping through zero volatility
+                vol = vol - step if step < vol else 0.5 * vol
+
+
+def implied_vol_batch_numba(
+        target_price: ArrayLike,
+        forward_price: ArrayLike,
+        strike: ArrayLike,
+        dcf: ArrayLike,
+        df: ArrayLike,
+        is_call: ArrayLike,
+        tol: float = 1e-8,
+        max_iter: int = 50,
+) -> np.ndarray:
+    """
+    Implied volatilities of a batch of SPX index option premiums under Black '76.
+
+    Vectorized counterpart of implied_vol_newton: every contract runs its own
+    Newton iteration in a parallel compiled loop, repricing with the
+    Abramowitz & Stegun CDF, so it returns the volatilities of
+    implied_vol_newton(..., cdf_method="as").
+
+    Args:
+        target_price: Observed option premiums per index point
+        forward_price: Forward index levels
+        strike: Strike prices
+        dcf: Day count fractions (time to expiry in years)
+        df: Discount factors e^(-rT)
+        is_call: True for calls, False for puts
+        tol: Absolute tolerance on the repriced premium
+        max_iter: Maximum number of Newton steps
+
+    Returns:
+        Array of implied volatilities, NaN where the premium violates the
+        no-arbitrage bounds or the iteration does not converge
+    """
+    target_price, forward_price, strike, dcf, df, is_call = _broadcast_arrays(
+        target_price, forward_price, strike, dcf, df, is_call=is_call
+    )
+    _check_inputs(forward_price=forward_price, strike=strike, dcf=dcf, df=df)
+
+    shape = target_price.shape
+    flat = [np.ascontiguousarray(x).ravel() for x in (target_price, forward_price, strike, dcf, df, is_call)]
+
+    out = np.empty(flat[0].shape[0])
+    _implied_vol_kernel(*flat, tol, max_iter, out)
+
+    return out.reshape(shape)
@@ -5,17 +5,23 @@ Black '76 model for pricing options.
 """
 
 import os
+import json
+import math
+import base64
 import logging
+import functools
 from typing import Annotated
 import asyncio
 
+import numpy as np
 # from mcp.server.fastmcp import FastMCP
 from fastmcp import FastMCP
 from pydantic import Field
 
 from src.pricing.black76 import (
-    OptionType,
-    black76_price
+    SPXOptionResult,
+    _black76_unchecked,
+    black76_price_batch,
 )
 
 logging.basicConfig(
@@ -28,62 +34,169 @@ mcp = FastMCP(
     name="option-pricing-server"
 )
 
+@functools.lru_cache(maxsize=4096)
+def _black76_cached(
+        forward_price: float,
+        strike: float,
+        dcf: float,
+        df: float,
+        implied_volatility: float,
+        is_call: bool,
+) -> SPXOptionResult:
+    """Memoized black76_price keyed on the exact inputs; inputs must be pre-validated."""
+    return _black76_unchecked(forward_price, strike, dcf, df, implied_volatility, is_call)
+
+
+# Success payload of price_option_black76, rendered with one str.format call
+# (fixed-point format specs do the rounding) instead of nested dicts + round().
+_PRICE_RESPONSE_TEMPLATE = (
+    '{{"status": "success", "instrument": "Option", "model": "Black \'76", "type": "{type}", '
+    '"inputs": {{"forward": {forward!r}, "strike": {strike!r}}}, '
+    '"pricing": {{"premium": {premium:.2f}}}, '
+    '"greeks": {{"delta": {delta:.4f}, "gamma": {gamma:.6f}, "vega_per_1pct_usd": {vega_usd:.2f}}}}}'
+)
+
 
 from starlette.responses import JSONResponse
 
+_TOOL_NAMES = ("price_option_black76", "price_options_batch")
+
+# Static route payloads, built once and shared by every request (never mutated)
+_HEALTH_PAYLOAD = {"status": "healthy"}
+_ROOT_PAYLOAD = {
+    "service": "Option Pricing MCP Server",
+    "model": "Black '76",
+    "tools": list(_TOOL_NAMES),
+}
+
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
-    return JSONResponse({"status": "healthy"})
+    return JSONResponse(_HEALTH_PAYLOAD)
 
 
 @mcp.custom_route("/", methods=["GET"])
 async def root(request):
-    return JSONResponse({
-        "service": "Option Pricing MCP Server",
-        "model": "Black '76",
-        "tools": ["price_option_black76"],
-    })
+    return JSONResponse(_ROOT_PAYLOAD)
 
 @mcp.tool()
 def price_option_black76(
-        forward_price: Annotated[float, Field(gt=0, description="Current SPX index level (e.g., 5000)")],
-        strike: Annotated[float, Field(gt=0, description="Strike price")],
-        dcf: Annotated[float, Field(description=" day count fraction")],
-        df: Annotated[float, Field(gt=0, description="discount factor")],
-        implied_volatility: Annotated[float, Field(gt=0, description="Implied volatility (e.g., 0.15 for 15%)")],
+        forward_price: Annotated[float, Field(gt=0, allow_inf_nan=False, description="Current SPX index level (e.g., 5000)")],
+        strike: Annotated[float, Field(gt=0, allow_inf_nan=False, description="Strike price")],
+        dcf: Annotated[float, Field(gt=0, allow_inf_nan=False, description=" day count fraction")],
+        df: Annotated[float, Field(gt=0, allow_inf_nan=False, description="discount factor")],
+        implied_volatility: Annotated[float, Field(gt=0, allow_inf_nan=False, description="Implied volatility (e.g., 0.15 for 15%)")],
         option_type: Annotated[str, Field(pattern="^(call|put)$", description="'call' or 'put'")]
 
-) -> dict:
+) -> str:
     """
     Price an SPX index option using Black '76 model.
 
     SPX options are European-style, cash-settled options on the S&P 500.
     The multiplier is $100 per index point.
 
-    Returns the option premium and all Greeks.
+    Returns the option premium and all Greeks as a compact single-line JSON
+    string with fixed decimals: premium and vega to 2, delta to 4, gamma to 6.
+    Errors are returned as {"status": "error", "message": ...} in the same form.
     """
     #logger.info(f"price_option: SPX={spot}, K={strike}, DTE={days_to_expiry}, σ={volatility}")
 
     try:
-        result = black76_price(forward_price, strike,dcf, df, implied_volatility, option_type=OptionType(option_type)
+        is_call = option_type == "call"
+        price, delta, gamma, vega = _black76_cached(
+            forward_price, strike, dcf, df, implied_volatility, is_call
+        )
+        # The template writes floats verbatim; inf/nan would not be valid JSON
+        if not all(map(math.isfinite, (price, delta, gamma, vega))):
+            raise ValueError("Inputs produce a non-finite price or Greek")
+
+        return _PRICE_RESPONSE_TEMPLATE.format(
+            type="CALL" if is_call else "PUT",
+            forward=forward_price,
+            strike=strike,
+            premium=price,
+            delta=delta,
+            gamma=gamma,
+            vega_usd=vega * 100,
+        )
+
+    except ValueError as e:
+        return json.dumps({"status": "error", "message": str(e)})
+    except Exception as e:
+        logger.exception(f"Error: {e}")
+        return json.dumps({"status": "error", "message": str(e)})
+
+def _pack_float32(values: np.ndarray) -> str:
+    """Base64 of the values as little-endian float32 bytes."""
+    return base64.b64encode(values.astype("<f4").tobytes()).decode("ascii")
+
+
+@mcp.tool()
+def price_options_batch(
+        forward_prices: Annotated[list[float], Field(min_length=1, description="Forward index level per contract")],
+        strikes: Annotated[list[float], Field(min_length=1, description="Strike price per contract")],
+        dcfs: Annotated[list[float], Field(min_length=1, description="Day count fraction per contract")],
+        dfs: Annotated[list[float], Field(min_length=1, description="Discount factor per contract")],
+        implied_volatilities: Annotated[list[float], Field(min_length=1, description="Implied volatility per contract")],
+        option_types: Annotated[list[Annotated[str, Field(pattern="^(call|put)$")]], Field(min_length=1, description="'call' or 'put' per contract")],
+        encoding: Annotated[str, Field(pattern="^(json|float32)$", description="'json' for number lists, 'float32' for base64 little-endian float32 arrays")] = "json",
+
+) -> dict:
+    """
+    Price a batch of SPX index options using Black '76 model.
+
+    All arguments are parallel lists: element i of each list describes contract i.
+    The whole batch is priced in one vectorized pass.
+
+    Returns premiums and Greeks as parallel lists in input order. With
+    encoding="float32" each list is instead a base64 string of little-endian
+    float32 values, roughly halving the payload for large batches.
+    """
+    try:
+        count = len(forward_prices)
+        if any(len(values) != count for values in (strikes, dcfs, dfs, implied_volatilities, option_types)):
+            raise ValueError("All input lists must have the same length")
+
+        result = black76_price_batch(
+            forward_prices,
+            strikes,
+            dcfs,
+            dfs,
+            implied_volatilities,
+            [option_type == "call" for option_type in option_types],
         )
+        # Tiny dcf × volatility products can overflow to inf/nan, which is not valid JSON
+        if not all(np.isfinite(values).all() for values in (result.price, result.delta, result.gamma, result.vega)):
+            raise ValueError("Inputs produce a non-finite price or Greek")
+
+        if encoding == "float32":
+            return {
+                "status": "success",
+                "instrument": "Option",
+                "model": "Black '76",
+                "count": count,
+                "dtype": "float32",
+                "pricing": {
+                    "premium": _pack_float32(result.price),
+                },
+                "greeks": {
+                    "delta": _pack_float32(result.delta),
+                    "gamma": _pack_float32(result.gamma),
+                    "vega_per_1pct_usd": _pack_float32(result.vega * 100),
+                },
+            }
 
         return {
             "status": "success",
             "instrument": "Option",
             "model": "Black '76",
-            "type": option_type.upper(),
-            "inputs": {
-                "forward": forward_price,
-                "strike": strike,
-            },
+            "count": count,
             "pricing": {
-                "premium": round(result.price, 2),
+                "premium": np.round(result.price, 2).tolist(),
             },
             "greeks": {
-                "delta": round(result.delta, 4),
-                "gamma": round(result.gamma, 6),
-                "vega_per_1pct_usd": round(result.vega * 100, 2),
+                "delta": np.round(result.delta, 4).tolist(),
+                "gamma": np.round(result.gamma, 6).tolist(),
+                "vega_per_1pct_usd": np.round(result.vega * 100, 2).tolist(),
             },
         }
 
@@ -103,7 +216,7 @@ def main() -> None:
     logger.info("Model: Black '76")
     logger.info("=" * 60)
     logger.info(f"Listening on {host}:{port}")
-    logger.info("Tools: price_option_black76")
+    logger.info(f"Tools: {', '.join(_TOOL_NAMES)}")
     logger.info("=" * 60)
 
     asyncio.run(mcp.run_async(transport="streamable-http",  host=host, port=port,))
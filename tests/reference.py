@@ -0,0 +1,63 @@
+"""
+Exact Black '76 reference shared by the pricing tests.
+
+Uses math.erfc, exact to double precision in both tails, and no tail cutoffs.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+# A&S 26.2.17 error bound on N(x)
+AS_ERROR = 7.5e-8
+
+# forward, strike, dcf, df, implied volatility
+CASES = [
+    pytest.param(5000.0, 5000.0, 0.25, 0.99, 0.15, id="atm"),
+    pytest.param(5000.0, 4500.0, 0.5, 0.98, 0.2, id="itm-call"),
+    pytest.param(5000.0, 5600.0, 1.0, 0.95, 0.35, id="otm-call"),
+    pytest.param(5000.0, 5000.0, 1.0 / (365 * 24 * 60), 1.0, 0.2, id="one-minute"),
+    pytest.param(5000.0, 4700.0, 0.01, 0.999, 0.1, id="near-cutoff"),
+    pytest.param(5000.0, 2000.0, 0.05, 0.99, 0.15, id="both-d-in-tail"),
+    pytest.param(1e6, 1e-5, 1.0, 1.0, 4.0, id="only-d1-in-tail"),
+    pytest.param(100.0, 100.0, 2.0, 0.9, 1.5, id="high-vol"),
+]
+
+
+def norm_cdf_exact(x: float) -> float:
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+
+def black76_exact(forward_price, strike, dcf, df, implied_volatility, is_call):
+    """Textbook Black '76 (price, delta, gamma, vega per 1%) without tail cutoffs."""
+    vol_sqrt_t = implied_volatility * math.sqrt(dcf)
+    d_1 = (math.log(forward_price / strike) + 0.5 * implied_volatility ** 2 * dcf) / vol_sqrt_t
+    d_2 = d_1 - vol_sqrt_t
+    pdf_d1 = math.exp(-0.5 * d_1 * d_1) / math.sqrt(2.0 * math.pi)
+    if is_call:
+        price = df * (forward_price * norm_cdf_exact(d_1) - strike * norm_cdf_exact(d_2))
+        delta = df * norm_cdf_exact(d_1)
+    else:
+        price = df * (strike * norm_cdf_exact(-d_2) - forward_price * norm_cdf_exact(-d_1))
+        delta = -df * norm_cdf_exact(-d_1)
+    gamma = df * pdf_d1 / (forward_price * vol_sqrt_t)
+    vega = df * forward_price * pdf_d1 * math.sqrt(dcf) / 100.0
+    return price, delta, gamma, vega
+
+
+def assert_matches_exact(result, forward_price, strike, dcf, df, implied_volatility, is_call, cdf_error=0.0):
+    """Compare (price, delta, gamma, vega) with the exact reference, allowing a CDF error."""
+    price, delta, gamma, vega = black76_exact(forward_price, strike, dcf, df, implied_volatility, is_call)
+    # 1e-12 relative slack for rounding; tail cutoffs drop N(-8) ~ 6e-16 of F or K
+    assert float(result[0]) == pytest.approx(price, rel=1e-12, abs=(cdf_error + 1e-15) * (forward_price + strike))
+    assert float(result[1]) == pytest.approx(delta, rel=1e-12, abs=cdf_error + 1e-15)
+    assert float(result[2]) == pytest.approx(gamma, rel=1e-9, abs=1e-15)
+    assert float(result[3]) == pytest.approx(vega, rel=1e-9, abs=1e-10)
+
+
+def case_arrays():
+    """CASES as flat arrays, each contract priced as a call and as a put."""
+    inputs = np.repeat(np.array([case.values for case in CASES]), 2, axis=0)
+    is_call = np.tile([True, False], len(CASES))
+    return (*inputs.T, is_call)
@@ -0,0 +1,268 @@
+"""
+Tests for the Black '76 pricing kernels.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.pricing import black76
+from src.pricing.black76 import (
+    OptionType,
+    black76_price,
+    black76_price_batch,
+    implied_vol_newton,
+    make_pricer,
+    norm_cdf,
+    norm_pdf,
+)
+from tests.reference import AS_ERROR, CASES, assert_matches_exact, case_arrays, norm_cdf_exact
+
+
+@pytest.mark.parametrize("x", [-40.0, -8.5, -3.0, -0.5, 0.0, 0.5, 3.0, 8.5, 40.0])
+def test_norm_cdf_is_exact(x):
+    assert norm_cdf(x) == pytest.approx(norm_cdf_exact(x), rel=1e-14, abs=1e-16)
+
+
+@pytest.mark.parametrize("x", [-math.inf, -40.0, -8.5, -3.0, -0.5, 0.0, 0.5, 3.0, 8.5, 40.0, math.inf])
+def test_norm_cdf_from_pdf_within_as_error(x):
+    pdf = norm_pdf(x) if math.isfinite(x) else 0.0
+    assert black76._norm_cdf_from_pdf(x, pdf) == pytest.approx(norm_cdf_exact(x), abs=AS_ERROR)
+
+
+def test_norm_cdf_propagates_nan():
+    assert math.isnan(norm_cdf(math.nan))
+    assert math.isnan(black76._norm_cdf_from_pdf(math.nan, norm_pdf(math.nan)))
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled", "python"])
+@pytest.mark.parametrize("cdf_method, cdf_error", [("erf", 0.0), ("as", AS_ERROR), ("logistic", 0.01)])
+@pytest.mark.parametrize("is_call", [True, False])
+@pytest.mark.parametrize("forward, strike, dcf, df, iv", CASES)
+def test_price_matches_exact(monkeypatch, forward, strike, dcf, df, iv, is_call, cdf_method, cdf_error, compiled):
+    if compiled and black76._black76_compiled is None:
+        pytest.skip("compiled extension not built")
+    if not compiled:
+        monkeypatch.setattr(black76, "_black76_compiled", None)
+
+    result = black76_price(forward, strike, dcf, df, iv, "call" if is_call else "put", cdf_method=cdf_method)
+
+    assert_matches_exact(result, forward, strike, dcf, df, iv, is_call, cdf_error=cdf_error)
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled", "python"])
+@pytest.mark.parametrize("cdf_method", ["erf", "as"])
+@pytest.mark.parametrize("strike", [2000.0, 12000.0])
+def test_deep_wings_short_circuit_to_intrinsic(monkeypatch, strike, cdf_method, compiled):
+    if compiled and black76._black76_compiled is None:
+        pytest.skip("compiled extension not built")
+    if not compiled:
+        monkeypatch.setattr(black76, "_black76_compiled", None)
+    forward, dcf, df = 5000.0, 0.05, 0.99
+
+    # |d1|, |d2| > 25: both CDFs are cut off to 0/1 and φ to 0
+    call = black76_price(forward, strike, dcf, df, 0.15, "call", cdf_method=cdf_method)
+    put = black76_price(forward, strike, dcf, df, 0.15, "put", cdf_method=cdf_method)
+
+    itm_call = strike < forward
+    assert call.price == (df * (forward - strike) if itm_call else 0.0)
+    assert put.price == (0.0 if itm_call else df * (strike - forward))
+    assert call.delta == (df if itm_call else 0.0)
+    assert put.delta == (0.0 if itm_call else -df)
+    assert call.gamma == put.gamma == 0.0
+    assert call.vega == put.vega == 0.0
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled", "python"])
+@pytest.mark.parametrize("forward, strike, dcf, df, iv", CASES)
+def test_put_call_parity(monkeypatch, forward, strike, dcf, df, iv, compiled):
+    if compiled and black76._black76_compiled is None:
+        pytest.skip("compiled extension not built")
+    if not compiled:
+        monkeypatch.setattr(black76, "_black76_compiled", None)
+
+    call = black76_price(forward, strike, dcf, df, iv, "call")
+    put = black76_price(forward, strike, dcf, df, iv, "put")
+
+    # C - P = df × (F - K) and Δc - Δp = df; gamma and vega do not depend on the type
+    assert call.price - put.price == pytest.approx(df * (forward - strike), rel=1e-12, abs=1e-12 * forward)
+    assert call.delta - put.delta == pytest.approx(df, rel=1e-12)
+    assert call.gamma == put.gamma
+    assert call.vega == put.vega
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled", "python"])
+def test_deep_otm_put_premium_is_not_negative_zero(monkeypatch, compiled):
+    if compiled and black76._black76_compiled is None:
+        pytest.skip("compiled extension not built")
+    if not compiled:
+        monkeypatch.setattr(black76, "_black76_compiled", None)
+    args = (5000.0, 2000.0, 0.05, 0.99, 0.15)
+
+    premiums = [
+        black76_price(*args, "put").price,
+        black76._black76_unchecked(*args, False).price,
+        make_pricer(0.05, 0.99, "put")(5000.0, 2000.0, 0.15).price,
+        float(black76_price_batch(*args, False).price),
+    ]
+
+    for premium in premiums:
+        # The batch without the SIMD kernel has no cutoff and may return ~1e-164
+        assert math.copysign(1.0, premium) == 1.0 and premium < 1e-12
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["compiled", "python"])
+@pytest.mark.parametrize("option_type", ["call", "put"])
+@pytest.mark.parametrize("forward, strike, dcf, df, iv", CASES)
+def test_make_pricer_matches_scalar(monkeypatch, forward, strike, dcf, df, iv, option_type, compiled):
+    if compiled and black76._black76_compiled is None:
+        pytest.skip("compiled extension not built")
+    if not compiled:
+        monkeypatch.setattr(black76, "_black76_compiled", None)
+
+    pricer = make_pricer(dcf, df, option_type)
+
+    assert pricer(forward, strike, iv) == black76_price(forward, strike, dcf, df, iv, option_type)
+    assert make_pricer(dcf, df, option_type.upper()) is pricer
+
+
+@pytest.mark.parametrize("forward, strike, iv", [(0.0, 5000.0, 0.15), (5000.0, -1.0, 0.15), (5000.0, 5000.0, 0.0)])
+def test_make_pricer_rejects_invalid_inputs(forward, strike, iv):
+    with pytest.raises(ValueError):
+        make_pricer(0.25, 0.99, "call")(forward, strike, iv)
+    with pytest.raises(ValueError):
+        make_pricer(0.0, 0.99, "call")
+
+
+@pytest.mark.parametrize("bad", [math.nan, math.inf, -math.inf, 0.0, -1.0])
+@pytest.mark.parametrize("position", range(5))
+def test_price_rejects_invalid_inputs(position, bad):
+    args = [5000.0, 5100.0, 0.25, 0.99, 0.15]
+    args[position] = bad
+    with pytest.raises(ValueError, match="must be positive and finite"):
+        black76_price(*args, "call")
+
+
+@pytest.mark.parametrize("cdf_method", ["erf", "as"])
+@pytest.mark.parametrize("option_type", ["call", "put"])
+# near-cutoff and the tail cases have almost no vega, so their volatility is ill-conditioned
+@pytest.mark.parametrize("forward, strike, dcf, df, iv", [CASES[i] for i in (0, 1, 2, 3, 7)])
+def test_implied_vol_round_trip(forward, strike, dcf, df, iv, option_type, cdf_method):
+    premium = black76_price(forward, strike, dcf, df, iv, option_type, cdf_method=cdf_method).price
+
+    implied = implied_vol_newton(premium, forward, strike, dcf, df, option_type, cdf_method=cdf_method)
+
+    assert implied == pytest.approx(iv, abs=1e-6)
+
+
+@pytest.mark.parametrize("target", [0.0, 50.0, 6000.0, math.nan])
+def test_implied_vol_rejects_prices_outside_bounds(target):
+    # Put bounds at F=5000, K=5100, df=0.99: (99, 5049)
+    with pytest.raises(ValueError, match="Price must lie in"):
+        implied_vol_newton(target, 5000.0, 5100.0, 0.25, 0.99, "put")
+
+
+@pytest.mark.parametrize("position", range(4))
+def test_implied_vol_rejects_invalid_inputs(position):
+    args = [5000.0, 5100.0, 0.25, 0.99]
+    args[position] = 0.0
+    with pytest.raises(ValueError, match="must be positive and finite"):
+        implied_vol_newton(150.0, *args, "put")
+
+
+@pytest.mark.parametrize("is_call, option_types", [
+    (True, [OptionType.CALL, "call", "CALL"]),
+    (False, [OptionType.PUT, "put", "Put"]),
+])
+def test_unchecked_bool_flag_matches_option_type(is_call, option_types):
+    args = (5000.0, 5100.0, 0.25, 0.99, 0.15)
+    result = black76._black76_unchecked(*args, is_call)
+    for option_type in option_types:
+        assert black76_price(*args, option_type) == result
+
+
+def test_price_defaults_to_erf():
+    args = (5000.0, 5100.0, 0.25, 0.99, 0.15, "call")
+    assert black76_price(*args) == black76_price(*args, cdf_method="erf")
+
+
+def test_price_rejects_unknown_cdf_method():
+    with pytest.raises(ValueError):
+        black76_price(5000.0, 5100.0, 0.25, 0.99, 0.15, "call", cdf_method="taylor")
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+@pytest.mark.parametrize("forward, strike, dcf, df, iv", CASES)
+def test_compiled_kernel_matches_python_as(monkeypatch, forward, strike, dcf, df, iv, is_call):
+    if black76._black76_compiled is None:
+        pytest.skip("compiled extension not built")
+    args = (forward, strike, dcf, df, iv, is_call)
+    compiled = black76._black76_unchecked(*args, cdf_method="as")
+    monkeypatch.setattr(black76, "_black76_compiled", None)
+    python = black76._black76_unchecked(*args, cdf_method="as")
+
+    assert compiled == pytest.approx(python, rel=1e-12, abs=1e-15)
+
+
+@pytest.mark.parametrize("n", range(1, 12))
+def test_simd_norm_cdf_pdf(n):
+    if black76._norm_cdf_pdf_simd is None:
+        pytest.skip("compiled extension not built")
+    specials = [math.nan, math.inf, -math.inf, 8.0, -8.0, 8.5, -40.0]
+    x = np.linspace(-10.0, 10.0, n)
+    # Specials land in both the 4-wide AVX2 lanes and the scalar remainder
+    for i in range(0, n, 3):
+        x[i] = specials[i % len(specials)]
+
+    cdf, pdf = black76._norm_cdf_pdf_array(x)
+
+    for xi, c, p in zip(x, cdf, pdf):
+        if math.isnan(xi):
+            assert math.isnan(c) and math.isnan(p)
+        else:
+            assert c == pytest.approx(norm_cdf_exact(xi), abs=AS_ERROR)
+            assert p == pytest.approx(norm_pdf(xi) if abs(xi) <= 8.0 else 0.0, rel=1e-12, abs=1e-300)
+
+
+def test_simd_batch_matches_ndtr_batch(monkeypatch):
+    if black76._norm_cdf_pdf_simd is None:
+        pytest.skip("compiled extension not built")
+    # Strikes from deep ITM to deep OTM so both tails and the body are hit
+    strike = np.linspace(1000.0, 12000.0, 101)
+    args = (5000.0, strike, 0.05, 0.99, 0.15, np.arange(strike.size) % 2 == 0)
+
+    simd = black76_price_batch(*args)
+    monkeypatch.setattr(black76, "_norm_cdf_pdf_simd", None)
+    exact = black76_price_batch(*args)
+
+    np.testing.assert_allclose(simd.price, exact.price, rtol=0.0, atol=AS_ERROR * (5000.0 + strike.max()))
+    np.testing.assert_allclose(simd.delta, exact.delta, rtol=0.0, atol=AS_ERROR)
+    np.testing.assert_allclose(simd.gamma, exact.gamma, rtol=1e-9, atol=1e-15)
+    np.testing.assert_allclose(simd.vega, exact.vega, rtol=1e-9, atol=1e-12)
+
+
+def test_batch_matches_exact(monkeypatch):
+    monkeypatch.setattr(black76, "_norm_cdf_pdf_simd", None)
+    arrays = case_arrays()
+
+    result = black76_price_batch(*arrays)
+
+    assert len(result) == arrays[0].size
+    for i, row in enumerate(zip(result.price, result.delta, result.gamma, result.vega)):
+        assert_matches_exact(row, *(values[i] for values in arrays))
+
+
+def test_batch_keeps_input_shape():
+    result = black76_price_batch(5000.0, [[4900.0, 5000.0], [5100.0, 5200.0]], 0.25, 0.99, 0.15, True)
+    assert result.price.shape == (2, 2)
+    assert black76_price_batch(5000.0, 5000.0, 0.25, 0.99, 0.15, True).price.shape == ()
+
+
+@pytest.mark.parametrize("bad", [math.nan, math.inf, -math.inf, 0.0, -1.0])
+@pytest.mark.parametrize("position", range(5))
+def test_batch_rejects_invalid_inputs(position, bad):
+    args = [[5000.0, 5000.0], [5000.0, 5100.0], [0.25, 0.25], [0.99, 0.99], [0.15, 0.15]]
+    args[position][1] = bad
+    with pytest.raises(ValueError):
+        black76_price_batch(*args, [True, False])
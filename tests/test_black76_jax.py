@@ -0,0 +1,36 @@
+"""
+Tests for the JAX batch pricer.
+"""
+
+import numpy as np
+import pytest
+
+jax = pytest.importorskip("jax")
+
+from src.pricing.black76_jax import black76_price_batch_jax
+from tests.reference import assert_matches_exact, case_arrays
+
+
+def test_jax_batch_matches_exact():
+    arrays = case_arrays()
+
+    result = black76_price_batch_jax(*arrays)
+
+    assert result.price.dtype == np.float64
+    for i, row in enumerate(zip(result.price, result.delta, result.gamma, result.vega)):
+        assert_matches_exact(row, *(values[i] for values in arrays))
+
+
+def test_jax_batch_does_not_enable_x64_globally():
+    enabled = jax.config.jax_enable_x64
+
+    black76_price_batch_jax(5000.0, [4900.0, 5100.0], 0.25, 0.99, 0.15, [True, False])
+
+    assert jax.config.jax_enable_x64 == enabled
+    if not enabled:
+        assert jax.numpy.zeros(1).dtype == np.float32
+
+
+def test_jax_batch_keeps_input_shape():
+    result = black76_price_batch_jax(5000.0, [[4900.0, 5000.0], [5100.0, 5200.0]], 0.25, 0.99, 0.15, False)
+    assert result.price.shape == (2, 2)
@@ -0,0 +1,65 @@
+"""
+Tests for the Numba batch pricer and implied volatility solver.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from src.pricing import black76
+from src.pricing.black76 import implied_vol_newton
+from src.pricing.black76_numba import black76_price_batch_numba, implied_vol_batch_numba
+from tests.reference import AS_ERROR, assert_matches_exact, case_arrays
+
+
+def test_numba_batch_matches_exact():
+    arrays = case_arrays()
+
+    result = black76_price_batch_numba(*arrays)
+
+    for i, row in enumerate(zip(result.price, result.delta, result.gamma, result.vega)):
+        assert_matches_exact(row, *(values[i] for values in arrays), cdf_error=AS_ERROR)
+
+
+def test_numba_batch_keeps_input_shape():
+    result = black76_price_batch_numba(5000.0, [[4900.0, 5000.0], [5100.0, 5200.0]], 0.25, 0.99, 0.15, False)
+    assert result.price.shape == (2, 2)
+    np.testing.assert_array_less(0.0, result.price)
+
+
+def test_numba_batch_matches_python_as_kernel(monkeypatch):
+    monkeypatch.setattr(black76, "_black76_compiled", None)
+    arrays = case_arrays()
+
+    result = black76_price_batch_numba(*arrays)
+
+    for i, row in enumerate(zip(result.price, result.delta, result.gamma, result.vega)):
+        expected = black76._black76_unchecked(*(values[i] for values in arrays), cdf_method="as")
+        assert row == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+def test_numba_implied_vol_matches_scalar():
+    # near-cutoff and the tail cases have almost no vega, so their volatility is ill-conditioned
+    forward, strike, dcf, df, iv, is_call = (values[[0, 1, 2, 3, 4, 5, 6, 7, 14, 15]] for values in case_arrays())
+    premium = black76_price_batch_numba(forward, strike, dcf, df, iv, is_call).price
+
+    implied = implied_vol_batch_numba(premium, forward, strike, dcf, df, is_call)
+
+    for i in range(premium.size):
+        option_type = "call" if is_call[i] else "put"
+        expected = implied_vol_newton(premium[i], forward[i], strike[i], dcf[i], df[i], option_type, cdf_method="as")
+        assert implied[i] == pytest.approx(expected, abs=1e-9)
+        assert implied[i] == pytest.approx(iv[i], abs=1e-6)
+
+
+def test_numba_implied_vol_is_nan_outside_bounds():
+    # Put bounds at F=5000, K=5100, df=0.99: (99, 5049)
+    implied = implied_vol_batch_numba([0.0, 50.0, 6000.0, np.nan, 150.0], 5000.0, 5100.0, 0.25, 0.99, False)
+    assert np.isnan(implied[:4]).all()
+    assert np.isfinite(implied[4])
+
+
+def test_numba_implied_vol_rejects_invalid_inputs():
+    with pytest.raises(ValueError, match="Discount factor must be positive and finite"):
+        implied_vol_batch_numba([150.0], 5000.0, 5100.0, 0.25, [np.inf], False)
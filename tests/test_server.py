@@ -0,0 +1,167 @@
+"""
+MCP tool tests, calling the FastMCP server in memory.
+"""
+
+import asyncio
+import base64
+import json
+
+import numpy as np
+import pytest
+from fastmcp import Client
+
+from src.pricing.black76 import black76_price
+from src.server import _black76_cached, mcp
+
+
+def _reject_constant(name: str):
+    raise ValueError(f"{name} is not valid JSON")
+
+
+def _call(tool: str, arguments: dict) -> dict:
+    """Call an MCP tool and parse its text payload as strict JSON (no NaN/Infinity)."""
+    async def call():
+        async with Client(mcp) as client:
+            return await client.call_tool(tool, arguments)
+
+    content = asyncio.run(call())
+    return json.loads(content[0].text, parse_constant=_reject_constant)
+
+
+SINGLE = {
+    "forward_price": 5000.0,
+    "strike": 5100.0,
+    "dcf": 0.25,
+    "df": 0.99,
+    "implied_volatility": 0.15,
+    "option_type": "call",
+}
+
+
+def test_single_repeat_call_hits_cache():
+    _black76_cached.cache_clear()
+    first = _call("price_option_black76", SINGLE)
+    second = _call("price_option_black76", SINGLE)
+
+    assert first == second
+    assert _black76_cached.cache_info().hits == 1
+
+
+def test_single_one_minute_expiry_uses_exact_inputs():
+    # Rounding a one-minute dcf (~1.9e-6) to 6 decimals would price a different expiry
+    arguments = {**SINGLE, "strike": 5000.0, "dcf": 1.0 / (365 * 24 * 60)}
+    expected = black76_price(*arguments.values())
+
+    response = _call("price_option_black76", arguments)
+
+    assert response["status"] == "success"
+    assert response["pricing"]["premium"] == round(expected.price, 2)
+    assert response["greeks"]["delta"] == round(expected.delta, 4)
+    assert response["greeks"]["gamma"] == round(expected.gamma, 6)
+
+
+def _rounded_dict(forward_price, strike, dcf, df, implied_volatility, option_type):
+    """The tool response as the original dict + round() implementation built it."""
+    result = black76_price(forward_price, strike, dcf, df, implied_volatility, option_type)
+    return {
+        "status": "success",
+        "instrument": "Option",
+        "model": "Black '76",
+        "type": option_type.upper(),
+        "inputs": {
+            "forward": forward_price,
+            "strike": strike,
+        },
+        "pricing": {
+            "premium": round(result.price, 2),
+        },
+        "greeks": {
+            "delta": round(result.delta, 4),
+            "gamma": round(result.gamma, 6),
+            "vega_per_1pct_usd": round(result.vega * 100, 2),
+        },
+    }
+
+
+@pytest.mark.parametrize("arguments", [
+    pytest.param(SINGLE, id="call"),
+    pytest.param({**SINGLE, "strike": 4900.0, "option_type": "put"}, id="put"),
+    pytest.param({**SINGLE, "strike": 2000.0, "dcf": 0.05, "option_type": "put"}, id="deep-otm-put"),
+])
+def test_single_json_matches_rounded_dict(arguments):
+    assert _call("price_option_black76", arguments) == _rounded_dict(**arguments)
+
+
+def test_single_deep_otm_put_premium_is_not_negative_zero():
+    response = _call("price_option_black76", {**SINGLE, "strike": 2000.0, "dcf": 0.05, "option_type": "put"})
+    assert str(response["pricing"]["premium"]) == "0.0"
+
+
+def test_single_non_finite_result_is_an_error():
+    response = _call("price_option_black76", {**SINGLE, "dcf": 1e-300, "implied_volatility": 1e-300})
+    assert response["status"] == "error"
+
+
+BATCH = {
+    "forward_prices": [5000.0, 5000.0, 5000.0],
+    "strikes": [4800.0, 5100.0, 2000.0],
+    "dcfs": [0.25, 0.1, 0.05],
+    "dfs": [0.99, 0.995, 0.99],
+    "implied_volatilities": [0.15, 0.2, 0.15],
+    "option_types": ["call", "put", "put"],
+}
+
+
+def _expected_rows():
+    """Per-contract scalar results, rounded like the tool response."""
+    for i, option_type in enumerate(BATCH["option_types"]):
+        yield black76_price(
+            BATCH["forward_prices"][i], BATCH["strikes"][i], BATCH["dcfs"][i],
+            BATCH["dfs"][i], BATCH["implied_volatilities"][i], option_type,
+        )
+
+
+def test_batch_json_matches_scalar_pricer():
+    response = _call("price_options_batch", BATCH)
+
+    assert response["status"] == "success"
+    assert response["count"] == 3
+    for i, expected in enumerate(_expected_rows()):
+        # One unit in the last reported decimal covers A&S vs exact CDF differences
+        assert response["pricing"]["premium"][i] == pytest.approx(expected.price, abs=0.01)
+        assert response["greeks"]["delta"][i] == pytest.approx(expected.delta, abs=1e-4)
+        assert response["greeks"]["gamma"][i] == pytest.approx(expected.gamma, abs=1e-6)
+        assert response["greeks"]["vega_per_1pct_usd"][i] == pytest.approx(expected.vega * 100, abs=0.01)
+
+
+def _unpack_float32(payload: str) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(payload), "<f4")
+
+
+def test_batch_float32_decodes_to_json_values():
+    exact = _call("price_options_batch", BATCH)
+    packed = _call("price_options_batch", {**BATCH, "encoding": "float32"})
+
+    assert packed["status"] == "success"
+    assert packed["count"] == 3
+    assert packed["dtype"] == "float32"
+    for section, field, decimals in [
+        ("pricing", "premium", 2),
+        ("greeks", "delta", 4),
+        ("greeks", "gamma", 6),
+        ("greeks", "vega_per_1pct_usd", 2),
+    ]:
+        values = _unpack_float32(packed[section][field])
+        assert values.shape == (3,)
+        # float32 keeps ~7 significant digits; the JSON lists are rounded to `decimals`
+        np.testing.assert_allclose(values, exact[section][field], rtol=1e-6, atol=0.5 * 10.0 ** -decimals)
+
+
+def test_batch_non_finite_result_is_an_error():
+    response = _call("price_options_batch", {**BATCH, "dcfs": [1e-300] * 3, "implied_volatilities": [1e-300] * 3})
+    assert response == {"status": "error", "message": "Inputs produce a non-finite price or Greek"}
+
+
+def test_batch_length_mismatch_is_an_error():
+    response = _call("price_options_batch", {**BATCH, "strikes": [5000.0]})
+    assert response["status"] == "error"